@@ -595,8 +595,7 @@ class NestedSampler(Sampler):
         float: log_likelihood
         """
         if self.priors.evaluate_constraints({
-                key: theta[ii] for ii, key in
-                enumerate(self.search_parameter_keys)}):
+                key: t for key, t in zip(self._search_parameter_keys, theta)}):
             return Sampler.log_likelihood(self, theta)
         else:
             return np.nan_to_num(-np.inf)
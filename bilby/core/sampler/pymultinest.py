@@ -1,13 +1,16 @@
+import errno
 import importlib
 import os
 import tempfile
 import shutil
 import distutils.dir_util
 import signal
+import threading
 import time
 import datetime
 
 import numpy as np
+import pandas as pd
 
 from ..utils import check_directory_exists_and_if_not_mkdir
 from ..utils import logger
@@ -100,9 +103,13 @@ class Pymultinest(NestedSampler):
             )
         self.use_temporary_directory = temporary_directory and not using_mpi
 
-        signal.signal(signal.SIGTERM, self.write_current_state_and_exit)
-        signal.signal(signal.SIGINT, self.write_current_state_and_exit)
-        signal.signal(signal.SIGALRM, self.write_current_state_and_exit)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.write_current_state_and_exit)
+            signal.signal(signal.SIGINT, self.write_current_state_and_exit)
+            signal.signal(signal.SIGALRM, self.write_current_state_and_exit)
+        else:
+            logger.debug(
+                "Not in the main thread, signal handlers will not be set.")
 
     def _translate_kwargs(self, kwargs):
         if "n_live_points" not in kwargs:
@@ -129,12 +136,9 @@ class Pymultinest(NestedSampler):
 
     def _apply_multinest_boundaries(self):
         if self.kwargs["wrapped_params"] is None:
-            self.kwargs["wrapped_params"] = []
-            for param, value in self.priors.items():
-                if value.boundary == "periodic":
-                    self.kwargs["wrapped_params"].append(1)
-                else:
-                    self.kwargs["wrapped_params"].append(0)
+            self.kwargs["wrapped_params"] = [
+                1 if value.boundary == "periodic" else 0
+                for value in self.priors.values()]
 
     @property
     def outputfiles_basename(self):
@@ -160,10 +164,15 @@ class Pymultinest(NestedSampler):
                 temporary_outputfiles_basename
             )
         self._temporary_outputfiles_basename = temporary_outputfiles_basename
-        if os.path.exists(self.outputfiles_basename):
-            shutil.copytree(
-                self.outputfiles_basename, self.temporary_outputfiles_basename
-            )
+        if os.path.isdir(self.outputfiles_basename):
+            existing_files = os.listdir(self.outputfiles_basename)
+        else:
+            existing_files = []
+        if len(existing_files) > 0:
+            # Copy rather than move so the checkpoint stays in the output
+            # directory until the run writes its own
+            distutils.dir_util.copy_tree(
+                self.outputfiles_basename, self.temporary_outputfiles_basename)
 
     def write_current_state_and_exit(self, signum=None, frame=None):
         """ Write current state and exit on exit_code """
@@ -195,11 +204,22 @@ class Pymultinest(NestedSampler):
 
     def _move_temporary_directory_to_proper_path(self):
         """
-        Copy the temporary back to the proper path
+        Move the temporary back to the proper path
 
-        Anything in the temporary directory at this point is removed
+        Files are renamed where possible and only copied if the temporary
+        directory is on a different filesystem. Anything in the temporary
+        directory at this point is removed
         """
-        self._copy_temporary_directory_contents_to_proper_path()
+        logger.info(
+            "Overwriting {} with {}".format(
+                self.outputfiles_basename, self.temporary_outputfiles_basename
+            )
+        )
+        check_directory_exists_and_if_not_mkdir(self.outputfiles_basename)
+        for filename in os.listdir(self.temporary_outputfiles_basename):
+            _replace_or_move(
+                os.path.join(self.temporary_outputfiles_basename, filename),
+                os.path.join(self.outputfiles_basename, filename))
         shutil.rmtree(self.temporary_outputfiles_basename)
 
     def run_sampler(self):
@@ -228,7 +248,8 @@ class Pymultinest(NestedSampler):
         post_equal_weights = os.path.join(
             self.outputfiles_basename, "post_equal_weights.dat"
         )
-        post_equal_weights_data = np.loadtxt(post_equal_weights)
+        post_equal_weights_data = self._read_post_equal_weights(
+            post_equal_weights)
         self.result.log_likelihood_evaluations = post_equal_weights_data[:, -1]
         self.result.sampler_output = out
         self.result.samples = post_equal_weights_data[:, :-1]
@@ -239,6 +260,44 @@ class Pymultinest(NestedSampler):
         self.result.sampling_time = datetime.timedelta(seconds=self.total_sampling_time)
         return self.result
 
+    @staticmethod
+    def _read_post_equal_weights(post_equal_weights):
+        """
+        Read the post_equal_weights file written by MultiNest
+
+        A binary `.npy` copy is stored alongside the text file so that
+        repeated post-processing of the same run does not need to reparse
+        the text. The cached copy is only used if its modification time is
+        later than that of the text file. Only modification times are
+        compared, so if the text file is replaced by one with an older
+        modification time (e.g., with `cp -p`) the stale cached copy is
+        returned; delete the `.npy` file in that case. Failing to write the
+        cached copy does not prevent the samples being read.
+
+        Parameters
+        ----------
+        post_equal_weights: str
+            Path to the post_equal_weights.dat file
+
+        Returns
+        -------
+        array_like: The samples with the log-likelihood as the last column
+        """
+        cache_file = post_equal_weights + ".npy"
+        if os.path.exists(cache_file) and (
+                os.path.getmtime(cache_file) > os.path.getmtime(post_equal_weights)):
+            return np.load(cache_file)
+        post_equal_weights_data = pd.read_csv(
+            post_equal_weights, sep=r"\s+", header=None, dtype=np.float64,
+            comment="#").to_numpy()
+        try:
+            np.save(cache_file, post_equal_weights_data)
+        except OSError as e:
+            logger.debug(
+                "Unable to cache post_equal_weights to {}: {}".format(
+                    cache_file, e))
+        return post_equal_weights_data
+
     def _setup_run_directory(self):
         """
         If using a temporary directory, the output directory is moved to the
@@ -247,9 +306,6 @@ class Pymultinest(NestedSampler):
         if self.use_temporary_directory:
             temporary_outputfiles_basename = tempfile.TemporaryDirectory().name
             self.temporary_outputfiles_basename = temporary_outputfiles_basename
-
-            if os.path.exists(self.outputfiles_basename):
-                distutils.dir_util.copy_tree(self.outputfiles_basename, self.temporary_outputfiles_basename)
             check_directory_exists_and_if_not_mkdir(temporary_outputfiles_basename)
 
             self.kwargs["outputfiles_basename"] = self.temporary_outputfiles_basename
@@ -279,3 +335,16 @@ class Pymultinest(NestedSampler):
         if self.use_temporary_directory:
             self._move_temporary_directory_to_proper_path()
             self.kwargs["outputfiles_basename"] = self.outputfiles_basename
+
+
+def _replace_or_move(src, dst):
+    """
+    Rename src to dst, falling back to shutil.move if they are on different
+    filesystems
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
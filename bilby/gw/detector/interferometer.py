@@ -92,6 +92,7 @@ class Interferometer(object):
             minimum_frequency=minimum_frequency,
             maximum_frequency=maximum_frequency)
         self.meta_data = dict()
+        self._cached_antenna_response = None
 
     def __eq__(self, other):
         if self.name == other.name and \
@@ -280,6 +281,36 @@ class Interferometer(object):
         polarization_tensor = gwutils.get_polarization_tensor(ra, dec, time, psi, mode)
         return np.einsum('ij,ij->', self.geometry.detector_tensor, polarization_tensor)
 
+    def antenna_response_multiple_modes(self, ra, dec, time, psi, modes):
+        """
+        Calculate the antenna response function for multiple modes at a given
+        sky location
+
+        The responses for all of the modes are computed with a single
+        contraction against the detector tensor.
+
+        Parameters
+        -------
+        ra: float
+            right ascension in radians
+        dec: float
+            declination in radians
+        time: float
+            geocentric GPS time
+        psi: float
+            binary polarisation angle counter-clockwise about the direction of propagation
+        modes: list
+            polarisation modes (e.g. ['plus', 'cross'])
+
+        Returns
+        -------
+        array_like: The antenna response for each of the specified modes
+
+        """
+        polarization_tensors = gwutils.get_polarization_tensor_multiple_modes(
+            ra, dec, time, psi, modes)
+        return np.einsum('ij,mij->m', self.geometry.detector_tensor, polarization_tensors)
+
     def get_detector_response(self, waveform_polarizations, parameters):
         """ Get the detector response for a particular waveform
 
@@ -294,36 +325,74 @@ class Interferometer(object):
         -------
         array_like: A 3x3 array representation of the detector response (signal observed in the interferometer)
         """
-        signal = {}
-        for mode in waveform_polarizations.keys():
-            det_response = self.antenna_response(
-                parameters['ra'],
-                parameters['dec'],
-                parameters['geocent_time'],
-                parameters['psi'], mode)
+        modes = list(waveform_polarizations.keys())
+        det_response, time_shift = self._get_antenna_response_and_time_delay(
+            parameters, modes)
 
-            signal[mode] = waveform_polarizations[mode] * det_response
-        signal_ifo = sum(signal.values())
+        polarizations = [waveform_polarizations[mode] for mode in modes]
+        signal_ifo = np.zeros_like(
+            polarizations[0],
+            dtype=np.result_type(np.complex128, det_response, *polarizations))
+        for polarization, response in zip(polarizations, det_response):
+            signal_ifo += polarization * response
 
-        signal_ifo *= self.strain_data.frequency_mask
-
-        time_shift = self.time_delay_from_geocenter(
-            parameters['ra'], parameters['dec'], parameters['geocent_time'])
+        mask = self.strain_data.frequency_mask
+        signal_ifo *= mask
 
         # Be careful to first subtract the two GPS times which are ~1e9 sec.
         # And then add the time_shift which varies at ~1e-5 sec
         dt_geocent = parameters['geocent_time'] - self.strain_data.start_time
         dt = dt_geocent + time_shift
 
-        signal_ifo[self.strain_data.frequency_mask] = signal_ifo[self.strain_data.frequency_mask] * np.exp(
-            -1j * 2 * np.pi * dt * self.strain_data.frequency_array[self.strain_data.frequency_mask])
-
-        signal_ifo[self.strain_data.frequency_mask] *= self.calibration_model.get_calibration_factor(
-            self.strain_data.frequency_array[self.strain_data.frequency_mask],
-            prefix='recalib_{}_'.format(self.name), **parameters)
+        frequencies = self.strain_data.frequency_array[mask]
+        phase_and_calibration = np.exp(-2j * np.pi * dt * frequencies)
+        phase_and_calibration *= self.calibration_model.get_calibration_factor(
+            frequencies, prefix='recalib_{}_'.format(self.name), **parameters)
+        signal_ifo[mask] *= phase_and_calibration
 
         return signal_ifo
 
+    def _get_antenna_response_and_time_delay(self, parameters, modes):
+        """ Get the antenna responses and the time delay from the geocenter
+
+        The values for the most recent sky position, time and polarisation
+        angle are stored, so repeated calls which only change the intrinsic
+        parameters skip the calculation. They are recomputed if the
+        detector tensor or vertex have changed.
+
+        Parameters
+        -------
+        parameters: dict
+            parameters describing position and time of arrival of the signal
+        modes: list
+            polarisation modes (e.g. ['plus', 'cross'])
+
+        Returns
+        -------
+        det_response: array_like
+            The antenna response for each of the specified modes
+        time_shift: float
+            The time delay from geocenter in seconds
+        """
+        key = (parameters['ra'], parameters['dec'], parameters['geocent_time'],
+               parameters['psi'], tuple(modes))
+        # The geometry replaces these arrays whenever the detector changes
+        detector_tensor = self.geometry.detector_tensor
+        vertex = self.geometry.vertex
+        cached = getattr(self, '_cached_antenna_response', None)
+        if (cached is None or cached[0] != key or
+                cached[1] is not detector_tensor or cached[2] is not vertex):
+            det_response = self.antenna_response_multiple_modes(
+                parameters['ra'],
+                parameters['dec'],
+                parameters['geocent_time'],
+                parameters['psi'], modes)
+            time_shift = self.time_delay_from_geocenter(
+                parameters['ra'], parameters['dec'], parameters['geocent_time'])
+            cached = (key, detector_tensor, vertex, det_response, time_shift)
+            self._cached_antenna_response = cached
+        return cached[3], cached[4]
+
     def inject_signal(self, parameters, injection_polarizations=None,
                       waveform_generator=None):
         """ General signal injection method.
@@ -40,6 +40,9 @@ class PowerSpectralDensity(object):
             Interpolated function of the PSD
 
         """
+        # GravitationalWaveTransient checks whether its stored arrays are
+        # current by the identity of the cached psd_array, so it must be
+        # replaced rather than modified in place when the PSD changes.
         self._cache = dict(
             frequency_array=np.array([]), psd_array=None, asd_array=None)
         self.frequency_array = np.array(frequency_array)
@@ -58,6 +58,9 @@ class InterferometerStrainData(object):
 
         self._frequency_mask_updated = False
         self._frequency_mask = None
+        # GravitationalWaveTransient checks whether its stored arrays are
+        # current by the identity of this array, so it must be replaced
+        # rather than modified in place when the data change.
         self._frequency_domain_strain = None
         self._time_domain_strain = None
         self._channel = None
@@ -30,6 +30,13 @@ from .utils import (
 from .waveform_generator import WaveformGenerator
 from collections import namedtuple
 
+_InterferometerArrays = namedtuple('_InterferometerArrays',
+                                   ['frequency_domain_strain',
+                                    'power_spectral_density_array',
+                                    'frequency_mask',
+                                    'masked_frequency_domain_strain',
+                                    'masked_power_spectral_density_array'])
+
 
 class GravitationalWaveTransient(Likelihood):
     """ A gravitational-wave transient likelihood object
@@ -175,6 +182,11 @@ class GravitationalWaveTransient(Likelihood):
             priors['luminosity_distance'] = float(self._ref_dist)
             self._marginalized_parameters.append('luminosity_distance')
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_interferometer_arrays'] = dict()
+        return state
+
     def __repr__(self):
         return self.__class__.__name__ + '(interferometers={},\n\twaveform_generator={},\n\ttime_marginalization={}, ' \
                                          'distance_marginalization={}, phase_marginalization={}, priors={})'\
@@ -216,16 +228,25 @@ class GravitationalWaveTransient(Likelihood):
         """
         signal = interferometer.get_detector_response(
             waveform_polarizations, self.parameters)
-        d_inner_h = interferometer.inner_product(signal=signal)
-        optimal_snr_squared = interferometer.optimal_snr_squared(signal=signal)
+        arrays = self._get_interferometer_arrays(interferometer)
+        masked_signal = signal[arrays.frequency_mask]
+
+        d_inner_h = noise_weighted_inner_product(
+            aa=masked_signal, bb=arrays.masked_frequency_domain_strain,
+            power_spectral_density=arrays.masked_power_spectral_density_array,
+            duration=interferometer.strain_data.duration)
+        optimal_snr_squared = noise_weighted_inner_product(
+            aa=masked_signal, bb=masked_signal,
+            power_spectral_density=arrays.masked_power_spectral_density_array,
+            duration=interferometer.strain_data.duration)
         complex_matched_filter_snr = d_inner_h / (optimal_snr_squared**0.5)
 
         if self.time_marginalization:
             d_inner_h_squared_tc_array =\
                 4 / self.waveform_generator.duration * np.fft.fft(
                     signal[0:-1] *
-                    interferometer.frequency_domain_strain.conjugate()[0:-1] /
-                    interferometer.power_spectral_density_array[0:-1])
+                    arrays.frequency_domain_strain.conjugate()[0:-1] /
+                    arrays.power_spectral_density_array[0:-1])
         else:
             d_inner_h_squared_tc_array = None
 
@@ -737,6 +758,67 @@ class GravitationalWaveTransient(Likelihood):
     @interferometers.setter
     def interferometers(self, interferometers):
         self._interferometers = InterferometerList(interferometers)
+        self._interferometer_arrays = dict()
+
+    def _get_interferometer_arrays(self, interferometer):
+        """
+        Get the data, PSD and frequency mask for an interferometer
+
+        These are fixed during sampling so they are stored after the first
+        time each interferometer is used. They are recomputed if the
+        interferometer's data, frequency mask, window or PSD are replaced.
+        The stored arrays are not pickled. They are kept in double
+        precision, typical PSD values (~1e-46 / Hz) are below the range of
+        single precision.
+
+        Parameters
+        ----------
+        interferometer: bilby.gw.detector.Interferometer
+            The bilby interferometer object
+
+        Returns
+        -------
+        arrays: _InterferometerArrays
+            The full and masked frequency domain strain and PSD and the mask
+        """
+        interferometer_arrays = getattr(self, '_interferometer_arrays', None)
+        if interferometer_arrays is None:
+            interferometer_arrays = dict()
+            self._interferometer_arrays = interferometer_arrays
+        cached = interferometer_arrays.get(interferometer.name, None)
+        if cached is not None and all(
+                old is new for old, new in zip(
+                    cached[0], self._interferometer_arrays_key(interferometer))):
+            return cached[1]
+        frequency_domain_strain = interferometer.frequency_domain_strain
+        power_spectral_density = interferometer.power_spectral_density_array
+        mask = interferometer.frequency_mask
+        arrays = _InterferometerArrays(
+            frequency_domain_strain=frequency_domain_strain,
+            power_spectral_density_array=power_spectral_density,
+            frequency_mask=mask,
+            masked_frequency_domain_strain=frequency_domain_strain[mask],
+            masked_power_spectral_density_array=power_spectral_density[mask])
+        interferometer_arrays[interferometer.name] = (
+            self._interferometer_arrays_key(interferometer), arrays)
+        return arrays
+
+    @staticmethod
+    def _interferometer_arrays_key(interferometer):
+        """
+        The objects the stored interferometer arrays are derived from
+
+        Each of these is replaced, rather than modified in place, when the
+        data, frequency band, window or PSD of the interferometer changes.
+        This relies on the private `_frequency_domain_strain` of
+        `InterferometerStrainData` and `_cache` of `PowerSpectralDensity`,
+        which are documented as being replaced in those classes.
+        """
+        strain_data = interferometer.strain_data
+        power_spectral_density = interferometer.power_spectral_density
+        return (interferometer, strain_data, strain_data._frequency_domain_strain,
+                strain_data.frequency_mask, strain_data.window_factor,
+                power_spectral_density, power_spectral_density._cache['psd_array'])
 
     def _rescale_signal(self, signal, new_distance):
         for mode in signal:
@@ -1018,12 +1100,10 @@ class ROQGravitationalWaveTransient(GravitationalWaveTransient):
 
         """
 
-        f_plus = interferometer.antenna_response(
-            self.parameters['ra'], self.parameters['dec'],
-            self.parameters['geocent_time'], self.parameters['psi'], 'plus')
-        f_cross = interferometer.antenna_response(
+        f_plus, f_cross = interferometer.antenna_response_multiple_modes(
             self.parameters['ra'], self.parameters['dec'],
-            self.parameters['geocent_time'], self.parameters['psi'], 'cross')
+            self.parameters['geocent_time'], self.parameters['psi'],
+            ['plus', 'cross'])
 
         dt = interferometer.time_delay_from_geocenter(
             self.parameters['ra'], self.parameters['dec'],
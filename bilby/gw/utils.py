@@ -121,13 +121,52 @@ def get_polarization_tensor(ra, dec, time, psi, mode):
     array_like: A 3x3 representation of the polarization_tensor for the specified mode.
 
     """
+    m, n = _get_wave_frame_vectors(ra, dec, time, psi)
+    return _get_polarization_tensor_from_wave_frame(m, n, mode)
+
+
+def get_polarization_tensor_multiple_modes(ra, dec, time, psi, modes):
+    """
+    Calculate the polarization tensors for multiple modes at a given sky
+    location and time
+
+    This is equivalent to calling `get_polarization_tensor` for each mode,
+    but the wave-frame is only computed once.
+
+    Parameters
+    -------
+    ra: float
+        right ascension in radians
+    dec: float
+        declination in radians
+    time: float
+        geocentric GPS time
+    psi: float
+        binary polarisation angle counter-clockwise about the direction of propagation
+    modes: list
+        polarisation modes
+
+    Returns
+    -------
+    array_like: A (len(modes), 3, 3) array of the polarization tensors for the specified modes.
+
+    """
+    m, n = _get_wave_frame_vectors(ra, dec, time, psi)
+    return np.array([
+        _get_polarization_tensor_from_wave_frame(m, n, mode) for mode in modes])
+
+
+def _get_wave_frame_vectors(ra, dec, time, psi):
     gmst = fmod(lal.GreenwichMeanSiderealTime(time), 2 * np.pi)
     theta, phi = ra_dec_to_theta_phi(ra, dec, gmst)
     u = np.array([np.cos(phi) * np.cos(theta), np.cos(theta) * np.sin(phi), -np.sin(theta)])
     v = np.array([-np.sin(phi), np.cos(phi), 0])
     m = -u * np.sin(psi) - v * np.cos(psi)
     n = -u * np.cos(psi) + v * np.sin(psi)
+    return m, n
+
 
+def _get_polarization_tensor_from_wave_frame(m, n, mode):
     if mode.lower() == 'plus':
         return np.einsum('i,j->ij', m, m) - np.einsum('i,j->ij', n, n)
     elif mode.lower() == 'cross':
@@ -225,8 +264,7 @@ def noise_weighted_inner_product(aa, bb, power_spectral_density, duration):
     Noise-weighted inner product.
     """
 
-    integrand = np.conj(aa) * bb / power_spectral_density
-    return 4 / duration * np.sum(integrand)
+    return 4 / duration * np.vdot(aa, bb / power_spectral_density)
 
 
 def matched_filter_snr(signal, frequency_domain_strain, power_spectral_density, duration):
@@ -338,8 +338,16 @@ class TestInterferometer(unittest.TestCase):
                 self.ifo.detector_tensor.sum(),
             )
 
+    def test_antenna_response_multiple_modes(self):
+        modes = ["plus", "cross", "breathing"]
+        responses = self.ifo.antenna_response_multiple_modes(234, 52, 54, 76, modes)
+        for mode, response in zip(modes, responses):
+            self.assertAlmostEqual(
+                response, self.ifo.antenna_response(234, 52, 54, 76, mode))
+
     def test_get_detector_response_default_behaviour(self):
-        self.ifo.antenna_response = MagicMock(return_value=1)
+        self.ifo.antenna_response_multiple_modes = MagicMock(
+            side_effect=lambda ra, dec, time, psi, modes: np.ones(len(modes)))
         self.ifo.time_delay_from_geocenter = MagicMock(return_value=0)
         self.ifo.epoch = 0
         self.minimum_frequency = 10
@@ -355,7 +363,8 @@ class TestInterferometer(unittest.TestCase):
         )
 
     def test_get_detector_response_with_dt(self):
-        self.ifo.antenna_response = MagicMock(return_value=1)
+        self.ifo.antenna_response_multiple_modes = MagicMock(
+            side_effect=lambda ra, dec, time, psi, modes: np.ones(len(modes)))
         self.ifo.time_delay_from_geocenter = MagicMock(return_value=0)
         self.ifo.epoch = 1
         self.minimum_frequency = 10
@@ -373,7 +382,8 @@ class TestInterferometer(unittest.TestCase):
         self.assertTrue(np.allclose(abs(expected_response), abs(response)))
 
     def test_get_detector_response_multiple_modes(self):
-        self.ifo.antenna_response = MagicMock(return_value=1)
+        self.ifo.antenna_response_multiple_modes = MagicMock(
+            side_effect=lambda ra, dec, time, psi, modes: np.ones(len(modes)))
         self.ifo.time_delay_from_geocenter = MagicMock(return_value=0)
         self.ifo.epoch = 0
         self.minimum_frequency = 10
@@ -390,6 +400,66 @@ class TestInterferometer(unittest.TestCase):
             )
         )
 
+    def test_get_detector_response_reuses_sky_dependent_quantities(self):
+        self.ifo.antenna_response_multiple_modes = MagicMock(
+            side_effect=lambda ra, dec, time, psi, modes: np.ones(len(modes)))
+        self.ifo.time_delay_from_geocenter = MagicMock(return_value=0)
+        plus = np.linspace(0, 4096, 4097)
+        parameters = dict(ra=0, dec=0, geocent_time=0, psi=0)
+        self.ifo.get_detector_response(
+            waveform_polarizations=dict(plus=plus), parameters=parameters)
+        self.ifo.get_detector_response(
+            waveform_polarizations=dict(plus=2 * plus), parameters=parameters)
+        self.assertEqual(self.ifo.antenna_response_multiple_modes.call_count, 1)
+        self.assertEqual(self.ifo.time_delay_from_geocenter.call_count, 1)
+        parameters["psi"] = 1
+        self.ifo.get_detector_response(
+            waveform_polarizations=dict(plus=plus), parameters=parameters)
+        self.assertEqual(self.ifo.antenna_response_multiple_modes.call_count, 2)
+
+    def test_get_detector_response_updated_when_geometry_changes(self):
+        plus = np.linspace(0, 4096, 4097) * (1 + 1j)
+        parameters = dict(ra=1, dec=0.5, geocent_time=0, psi=0.3)
+        original = self.ifo.get_detector_response(
+            waveform_polarizations=dict(plus=plus), parameters=parameters)
+        self.ifo.latitude = 10.
+        self.ifo.longitude = 20.
+        response = self.ifo.get_detector_response(
+            waveform_polarizations=dict(plus=plus), parameters=parameters)
+        new_ifo = bilby.gw.detector.Interferometer(
+            name=self.name,
+            power_spectral_density=self.power_spectral_density,
+            minimum_frequency=self.minimum_frequency,
+            maximum_frequency=self.maximum_frequency,
+            length=self.length,
+            latitude=10.,
+            longitude=20.,
+            elevation=self.elevation,
+            xarm_azimuth=self.xarm_azimuth,
+            yarm_azimuth=self.yarm_azimuth,
+            xarm_tilt=self.xarm_tilt,
+            yarm_tilt=self.yarm_tilt,
+        )
+        new_ifo.strain_data = self.ifo.strain_data
+        expected = new_ifo.get_detector_response(
+            waveform_polarizations=dict(plus=plus), parameters=parameters)
+        self.assertTrue(np.array_equal(expected, response))
+        self.assertFalse(np.array_equal(original, response))
+
+    def test_get_detector_response_does_not_modify_polarizations(self):
+        self.ifo.antenna_response_multiple_modes = MagicMock(
+            side_effect=lambda ra, dec, time, psi, modes: 2 * np.ones(len(modes)))
+        self.ifo.time_delay_from_geocenter = MagicMock(return_value=0)
+        plus = np.linspace(0, 4096, 4097) * (1 + 1j)
+        cross = np.linspace(0, 4096, 4097) * (1 - 1j)
+        polarizations = dict(plus=plus.copy(), cross=cross.copy())
+        self.ifo.get_detector_response(
+            waveform_polarizations=polarizations,
+            parameters=dict(ra=0, dec=0, geocent_time=0, psi=0),
+        )
+        self.assertTrue(np.array_equal(polarizations["plus"], plus))
+        self.assertTrue(np.array_equal(polarizations["cross"], cross))
+
     def test_inject_signal_from_waveform_polarizations_correct_injection(self):
         original_strain = self.ifo.strain_data.frequency_domain_strain
         self.ifo.get_detector_response = lambda x, params: x["plus"] + x["cross"]
@@ -1,6 +1,7 @@
 from __future__ import division, absolute_import
 import unittest
 import os
+import pickle
 
 import numpy as np
 import bilby
@@ -206,6 +207,50 @@ class TestGWTransient(unittest.TestCase):
             == bilby.gw.detector.InterferometerList
         )
 
+    def test_interferometer_arrays_reset_with_interferometers(self):
+        self.likelihood.log_likelihood_ratio()
+        self.assertIn("H1", self.likelihood._interferometer_arrays)
+        self.likelihood.interferometers = self.interferometers
+        self.assertDictEqual(dict(), self.likelihood._interferometer_arrays)
+
+    def test_interferometer_arrays_match_interferometer(self):
+        ifo = self.interferometers[0]
+        arrays = self.likelihood._get_interferometer_arrays(ifo)
+        self.assertTrue(np.array_equal(
+            arrays.masked_frequency_domain_strain,
+            ifo.frequency_domain_strain[ifo.frequency_mask]))
+        self.assertTrue(np.array_equal(
+            arrays.masked_power_spectral_density_array,
+            ifo.power_spectral_density_array[ifo.frequency_mask]))
+
+    def test_interferometer_arrays_updated_when_data_changes(self):
+        self.likelihood.log_likelihood_ratio()
+        self.interferometers[0].set_strain_data_from_zero_noise(
+            sampling_frequency=self.sampling_frequency, duration=self.duration,
+            start_time=self.interferometers.start_time)
+        new_likelihood = bilby.gw.likelihood.GravitationalWaveTransient(
+            interferometers=self.interferometers,
+            waveform_generator=self.waveform_generator,
+            priors=self.prior.copy(),
+        )
+        new_likelihood.parameters = self.parameters.copy()
+        self.assertEqual(
+            new_likelihood.log_likelihood_ratio(),
+            self.likelihood.log_likelihood_ratio())
+
+    def test_pickle_after_evaluation(self):
+        self.likelihood.log_likelihood_ratio()
+        new_likelihood = pickle.loads(pickle.dumps(self.likelihood))
+        self.assertDictEqual(dict(), new_likelihood._interferometer_arrays)
+        self.assertEqual(
+            self.likelihood.log_likelihood_ratio(),
+            new_likelihood.log_likelihood_ratio())
+
+    def test_evaluation_without_stored_interferometer_arrays(self):
+        expected = self.likelihood.log_likelihood_ratio()
+        del self.likelihood._interferometer_arrays
+        self.assertEqual(expected, self.likelihood.log_likelihood_ratio())
+
     def test_meta_data(self):
         expected = dict(
             interferometers=self.interferometers.meta_data,
@@ -65,6 +65,19 @@ class TestGWUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             gwutils.get_polarization_tensor(ra, dec, time, psi, "not-a-mode")
 
+    def test_get_polarization_tensor_multiple_modes(self):
+        ra = 1
+        dec = 2.0
+        time = 10
+        psi = 0.1
+        modes = ["plus", "cross", "breathing", "longitudinal", "x", "y"]
+        tensors = gwutils.get_polarization_tensor_multiple_modes(
+            ra, dec, time, psi, modes)
+        self.assertEqual(tensors.shape, (6, 3, 3))
+        for mode, tensor in zip(modes, tensors):
+            self.assertTrue(np.allclose(
+                tensor, gwutils.get_polarization_tensor(ra, dec, time, psi, mode)))
+
     def test_inner_product(self):
         aa = np.array([1, 2, 3])
         bb = np.array([5, 6, 7])
@@ -81,7 +94,7 @@ class TestGWUtils(unittest.TestCase):
         psd = PSD.power_spectral_density_interpolated(frequency)
         duration = 4
         nwip = gwutils.noise_weighted_inner_product(aa, bb, psd, duration)
-        self.assertEqual(nwip, 239.87768033598326)
+        self.assertAlmostEqual(nwip, 239.87768033598326)
 
         self.assertEqual(
             gwutils.optimal_snr_squared(aa, psd, duration),
@@ -99,7 +112,7 @@ class TestGWUtils(unittest.TestCase):
         mfsnr = gwutils.matched_filter_snr(
             signal, frequency_domain_strain, psd, duration
         )
-        self.assertEqual(mfsnr, 25.510869054168282)
+        self.assertAlmostEqual(mfsnr, 25.510869054168282)
 
     def test_get_event_time(self):
         events = [
@@ -2,11 +2,13 @@ from __future__ import absolute_import
 import bilby
 from bilby.core import prior
 import unittest
-from mock import MagicMock
+from mock import MagicMock, patch
 import numpy as np
 import os
 import shutil
 import copy
+import errno
+import threading
 
 
 class TestSampler(unittest.TestCase):
@@ -760,6 +762,7 @@ class TestPymultinest(unittest.TestCase):
         del self.likelihood
         del self.priors
         del self.sampler
+        shutil.rmtree("outdir", ignore_errors=True)
 
     def test_default_kwargs(self):
         expected = dict(importance_nested_sampling=False, resume=True,
@@ -800,6 +803,126 @@ class TestPymultinest(unittest.TestCase):
             self.sampler.kwargs = new_kwargs
             self.assertDictEqual(expected, self.sampler.kwargs)
 
+    @staticmethod
+    def _write_file(filename, content):
+        with open(filename, "w") as ff:
+            ff.write(content)
+
+    @staticmethod
+    def _read_file(filename):
+        with open(filename, "r") as ff:
+            return ff.read()
+
+    def test_replace_or_move_overwrites_existing_file(self):
+        os.makedirs("outdir/src", exist_ok=True)
+        os.makedirs("outdir/dst", exist_ok=True)
+        self._write_file("outdir/src/file.txt", "new")
+        self._write_file("outdir/dst/file.txt", "old")
+        bilby.core.sampler.pymultinest._replace_or_move(
+            "outdir/src/file.txt", "outdir/dst/file.txt")
+        self.assertFalse(os.path.exists("outdir/src/file.txt"))
+        self.assertEqual("new", self._read_file("outdir/dst/file.txt"))
+
+    def test_replace_or_move_falls_back_to_move_across_filesystems(self):
+        os.makedirs("outdir", exist_ok=True)
+        self._write_file("outdir/src.txt", "content")
+        with patch("os.replace") as mock_replace:
+            mock_replace.side_effect = OSError(errno.EXDEV, "Invalid cross-device link")
+            with patch("shutil.move") as mock_move:
+                bilby.core.sampler.pymultinest._replace_or_move(
+                    "outdir/src.txt", "outdir/dst.txt")
+        mock_move.assert_called_once_with("outdir/src.txt", "outdir/dst.txt")
+
+    def test_replace_or_move_raises_other_errors(self):
+        with patch("os.replace") as mock_replace:
+            mock_replace.side_effect = OSError(errno.EACCES, "Permission denied")
+            with patch("shutil.move") as mock_move:
+                with self.assertRaises(OSError):
+                    bilby.core.sampler.pymultinest._replace_or_move(
+                        "outdir/src.txt", "outdir/dst.txt")
+        mock_move.assert_not_called()
+
+    def test_move_temporary_directory_to_proper_path(self):
+        self.sampler.outputfiles_basename = "outdir/pm_label/"
+        os.makedirs(self.sampler.outputfiles_basename, exist_ok=True)
+        self._write_file("outdir/pm_label/ev.dat", "old")
+        self._write_file("outdir/pm_label/other.dat", "untouched")
+        self.sampler._temporary_outputfiles_basename = "outdir/temporary/"
+        os.makedirs("outdir/temporary")
+        self._write_file("outdir/temporary/ev.dat", "new")
+        self._write_file("outdir/temporary/live.points", "points")
+        self.sampler._move_temporary_directory_to_proper_path()
+        self.assertFalse(os.path.exists("outdir/temporary"))
+        self.assertEqual("new", self._read_file("outdir/pm_label/ev.dat"))
+        self.assertEqual("points", self._read_file("outdir/pm_label/live.points"))
+        self.assertEqual("untouched", self._read_file("outdir/pm_label/other.dat"))
+
+    def test_temporary_outputfiles_basename_copies_existing_output(self):
+        self.sampler.outputfiles_basename = "outdir/pm_label/"
+        os.makedirs(self.sampler.outputfiles_basename, exist_ok=True)
+        self._write_file("outdir/pm_label/ev.dat", "checkpoint")
+        self.sampler.temporary_outputfiles_basename = "outdir/temporary"
+        self.assertEqual("checkpoint", self._read_file("outdir/temporary/ev.dat"))
+        self.assertEqual("checkpoint", self._read_file("outdir/pm_label/ev.dat"))
+
+    def test_temporary_outputfiles_basename_skips_empty_output(self):
+        self.sampler.outputfiles_basename = "outdir/pm_label/"
+        os.makedirs(self.sampler.outputfiles_basename, exist_ok=True)
+        self.sampler.temporary_outputfiles_basename = "outdir/empty_temporary"
+        self.assertFalse(os.path.exists("outdir/empty_temporary"))
+
+    def test_instantiation_outside_main_thread(self):
+        errors = []
+
+        def create_sampler():
+            try:
+                bilby.core.sampler.Pymultinest(
+                    self.likelihood, self.priors, outdir="outdir",
+                    label="label", skip_import_verification=True)
+            except ValueError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=create_sampler)
+        thread.start()
+        thread.join()
+        self.assertListEqual([], errors)
+
+    def test_read_post_equal_weights_writes_and_uses_cache(self):
+        os.makedirs("outdir", exist_ok=True)
+        filename = "outdir/post_equal_weights.dat"
+        data = np.random.uniform(0, 1, (10, 3))
+        np.savetxt(filename, data)
+        read_data = self.sampler._read_post_equal_weights(filename)
+        self.assertTrue(np.allclose(data, read_data))
+        self.assertTrue(os.path.exists(filename + ".npy"))
+        self.assertTrue(read_data.flags.writeable)
+        np.save(filename + ".npy", data[:5])
+        os.utime(filename + ".npy", (os.path.getmtime(filename) + 10,) * 2)
+        read_data = self.sampler._read_post_equal_weights(filename)
+        self.assertTrue(np.allclose(data[:5], read_data))
+        self.assertNotIsInstance(read_data, np.memmap)
+        self.assertTrue(read_data.flags.writeable)
+
+    def test_read_post_equal_weights_ignores_cache_write_failure(self):
+        os.makedirs("outdir", exist_ok=True)
+        filename = "outdir/post_equal_weights.dat"
+        data = np.random.uniform(0, 1, (10, 3))
+        np.savetxt(filename, data)
+        with patch("numpy.save") as mock_save:
+            mock_save.side_effect = OSError(errno.ENOSPC, "No space left on device")
+            read_data = self.sampler._read_post_equal_weights(filename)
+        self.assertTrue(np.allclose(data, read_data))
+        self.assertFalse(os.path.exists(filename + ".npy"))
+
+
+    def test_read_post_equal_weights_with_nan(self):
+        os.makedirs("outdir", exist_ok=True)
+        filename = "outdir/post_equal_weights.dat"
+        self._write_file(filename, "0.1 0.2 -1.0\n0.3 NaN -2.0\n")
+        read_data = self.sampler._read_post_equal_weights(filename)
+        self.assertEqual((2, 3), read_data.shape)
+        self.assertTrue(np.isnan(read_data[1, 1]))
+        self.assertTrue(np.allclose([0.1, 0.2, -1.0], read_data[0]))
 
 class TestUltranest(unittest.TestCase):
 